@@ -1,11 +1,30 @@
+import base64
+import hashlib
+import hmac
+import json
 import jwt
 import os
+import re
+import time
 from datetime import datetime, timedelta, timezone
 from dotenv import load_dotenv
+
+try:
+    import orjson
+    _json_dumps = orjson.dumps
+    _json_loads = orjson.loads
+except ImportError:
+    def _json_dumps(obj):
+        return json.dumps(obj, separators=(",", ":")).encode()
+    _json_loads = json.loads
 from starlette.middleware.base import BaseHTTPMiddleware
 from starlette.responses import JSONResponse
 
-load_dotenv()
+# Parse .env only once per process; re-imports (test collection, worker
+# restarts) see the flag and skip the file read.
+if not os.getenv("_JWT_ENV_LOADED"):
+    load_dotenv()
+    os.environ["_JWT_ENV_LOADED"] = "1"
 
 JWT_SECRET = os.getenv("JWT_SECRET_KEY", "default_secret")
 JWT_ALGORITHM = os.getenv("JWT_ALGORITHM", "HS256")
@@ -13,25 +32,94 @@ JWT_EXPIRATION = int(os.getenv("JWT_EXPIRATION_MINUTES", "30"))
 API_USERNAME = os.getenv("API_USERNAME", "admin")
 API_PASSWORD = os.getenv("API_PASSWORD", "secret123")
 
+# Derived once at import so token creation does no per-call setup work.
+_JWT_TTL = timedelta(minutes=JWT_EXPIRATION)
+_JWT_KEY = JWT_SECRET.encode() if isinstance(JWT_SECRET, str) else JWT_SECRET
+
+# Inline HS256 codec: for the one fixed algorithm used here, PyJWT's header
+# construction, algorithm dispatch and option handling are pure overhead, so
+# tokens are signed/verified directly with hmac + base64url. PyJWT stays as
+# the fallback for tokens whose header was produced by another encoder.
+_HEADER_B64 = base64.urlsafe_b64encode(b'{"alg":"HS256","typ":"JWT"}').rstrip(b"=")
+
+def _b64url_encode(data: bytes) -> bytes:
+    return base64.urlsafe_b64encode(data).rstrip(b"=")
+
+def _b64url_decode(data: bytes) -> bytes:
+    return base64.urlsafe_b64decode(data + b"=" * (-len(data) % 4))
+
+def _hs256_verify(token: str) -> dict:
+    try:
+        signing_input, signature = token.encode().rsplit(b".", 1)
+        header_b64, payload_b64 = signing_input.split(b".", 1)
+    except ValueError:
+        raise jwt.InvalidTokenError("Not enough segments")
+    digest = hmac.new(_JWT_KEY, signing_input, hashlib.sha256).digest()
+    if not hmac.compare_digest(_b64url_encode(digest), signature):
+        raise jwt.InvalidTokenError("Signature verification failed")
+    if header_b64 != _HEADER_B64:
+        # Signature already checked out; let PyJWT arbitrate foreign headers.
+        return jwt.decode(token, _JWT_KEY, algorithms=[JWT_ALGORITHM])
+    try:
+        payload = _json_loads(_b64url_decode(payload_b64))
+    except ValueError:
+        raise jwt.InvalidTokenError("Invalid payload")
+    exp = payload.get("exp")
+    if exp is not None:
+        # PyJWT answers InvalidTokenError for a malformed exp claim; keep the
+        # inline path in agreement instead of letting a TypeError escape.
+        if not isinstance(exp, (int, float)):
+            raise jwt.InvalidTokenError("Expiration Time claim (exp) must be a number")
+        if time.time() >= exp:
+            raise jwt.ExpiredSignatureError("Signature has expired")
+    return payload
+
 PUBLIC_PATHS = ["/login", "/healthz", "/docs", "/openapi.json", "/metrics", "/readyz", "/livez"]
 
+# Precompiled matcher so the hot path does one C-level regex match (with a
+# frozenset fast path for exact hits) instead of a Python loop of startswith.
+_PUBLIC_SET = frozenset(PUBLIC_PATHS)
+_PUBLIC_RE = re.compile("^(?:" + "|".join(re.escape(p) for p in PUBLIC_PATHS) + ")")
+
 def create_token(username: str) -> str:
+    now = datetime.now(timezone.utc)
     payload = {
         "sub": username,
-        "exp": datetime.now(timezone.utc) + timedelta(minutes=JWT_EXPIRATION),
-        "iat": datetime.now(timezone.utc)
+        "exp": int((now + _JWT_TTL).timestamp()),
+        "iat": int(now.timestamp())
     }
-    return jwt.encode(payload, JWT_SECRET, algorithm=JWT_ALGORITHM)
+    payload_b64 = _b64url_encode(_json_dumps(payload))
+    signing_input = _HEADER_B64 + b"." + payload_b64
+    signature = _b64url_encode(hmac.new(_JWT_KEY, signing_input, hashlib.sha256).digest())
+    return (signing_input + b"." + signature).decode()
+
+# Bounded TTL cache so repeated presentations of the same Bearer token skip
+# the HMAC + base64 + JSON work and cost a single dict lookup instead.
+_TOKEN_CACHE_MAX = 4096
+_TOKEN_CACHE_TTL = 30
+_token_cache = {}
 
 def verify_token(token: str) -> dict:
-    return jwt.decode(token, JWT_SECRET, algorithms=[JWT_ALGORITHM])
+    now = time.time()
+    cached = _token_cache.get(token)
+    if cached is not None:
+        cached_at, exp, payload = cached
+        if now - cached_at < _TOKEN_CACHE_TTL and now < exp:
+            return payload
+        del _token_cache[token]
+    payload = _hs256_verify(token)
+    if len(_token_cache) >= _TOKEN_CACHE_MAX:
+        _token_cache.clear()
+    _token_cache[token] = (now, payload.get("exp", now + _TOKEN_CACHE_TTL), payload)
+    return payload
 
 def validate_credentials(username: str, password: str) -> bool:
     return username == API_USERNAME and password == API_PASSWORD
 
 class JWTAuthMiddleware(BaseHTTPMiddleware):
     async def dispatch(self, request, call_next):
-        if any(request.url.path.startswith(p) for p in PUBLIC_PATHS):
+        path = request.url.path
+        if path in _PUBLIC_SET or _PUBLIC_RE.match(path):
             return await call_next(request)
         
         auth_header = request.headers.get("Authorization")
@@ -40,7 +128,9 @@ class JWTAuthMiddleware(BaseHTTPMiddleware):
         
         token = auth_header.split(" ")[1]
         try:
-            verify_token(token)
+            # Stash the claims so downstream dependencies can read them
+            # without paying for a second verification.
+            request.state.user = verify_token(token)
         except jwt.ExpiredSignatureError:
             return JSONResponse({"error": "Token expired"}, status_code=401)
         except jwt.InvalidTokenError:
@@ -0,0 +1,60 @@
+import asyncio
+import os
+
+import numpy as np
+
+MAX_BATCH_SIZE = int(os.getenv("PREDICT_MAX_BATCH_SIZE", "32"))
+MAX_LATENCY_MS = float(os.getenv("PREDICT_MAX_LATENCY_MS", "2.0"))
+
+class MicroBatcher:
+    """Coalesces concurrent single-row predictions into one vectorized call.
+
+    Rows submitted while a flush window is open are stacked into a single
+    matrix and predicted together, amortizing per-call overhead across
+    callers. A window flushes when it holds max_batch_size rows or when
+    max_latency_ms has elapsed since its first row, whichever comes first.
+    """
+
+    def __init__(self, predict_fn, max_batch_size: int = MAX_BATCH_SIZE,
+                 max_latency_ms: float = MAX_LATENCY_MS):
+        self._predict_fn = predict_fn
+        self._max_batch_size = max_batch_size
+        self._max_latency = max_latency_ms / 1000.0
+        self._pending = []
+        self._lock = asyncio.Lock()
+        self._flush_task = None
+
+    async def submit(self, row: np.ndarray) -> float:
+        future = asyncio.get_running_loop().create_future()
+        async with self._lock:
+            self._pending.append((row, future))
+            if len(self._pending) >= self._max_batch_size:
+                if self._flush_task is not None:
+                    self._flush_task.cancel()
+                    self._flush_task = None
+                self._flush()
+            elif self._flush_task is None:
+                self._flush_task = asyncio.create_task(self._flush_after_wait())
+        return await future
+
+    async def _flush_after_wait(self):
+        await asyncio.sleep(self._max_latency)
+        async with self._lock:
+            self._flush_task = None
+            self._flush()
+
+    def _flush(self):
+        # Caller must hold self._lock.
+        pending, self._pending = self._pending, []
+        if not pending:
+            return
+        try:
+            predictions = self._predict_fn(np.stack([row for row, _ in pending]))
+        except Exception as exc:
+            for _, future in pending:
+                if not future.done():
+                    future.set_exception(exc)
+            return
+        for (_, future), prediction in zip(pending, predictions):
+            if not future.done():
+                future.set_result(float(prediction))
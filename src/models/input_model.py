@@ -0,0 +1,31 @@
+from typing import List
+
+from pydantic import BaseModel, field_validator
+
+MAX_BATCH_SIZE = 1000
+
+class LoginRequest(BaseModel):
+    username: str
+    password: str
+
+class AdmissionInput(BaseModel):
+    gre_score: float
+    toefl_score: float
+    university_rating: float
+    sop: float
+    lor: float
+    cgpa: float
+    research: int
+
+class AdmissionOutput(BaseModel):
+    chance_of_admit: float
+
+class BatchAdmissionInput(BaseModel):
+    inputs: List[AdmissionInput]
+
+    @field_validator("inputs")
+    @classmethod
+    def check_batch_size(cls, v):
+        if not 1 <= len(v) <= MAX_BATCH_SIZE:
+            raise ValueError(f"batch size must be between 1 and {MAX_BATCH_SIZE}")
+        return v
@@ -0,0 +1,32 @@
+import numpy as np
+
+try:
+    from numba import njit
+except ImportError:
+    njit = None
+
+if njit is not None:
+    # Fused scalar loop; numba vectorizes it into FMA instructions and
+    # removes the NumPy dispatch overhead per call.
+    @njit(cache=True, fastmath=True)
+    def _predict_jit(X, w, b):
+        out = np.empty(X.shape[0])
+        for i in range(X.shape[0]):
+            s = b
+            for j in range(X.shape[1]):
+                s += X[i, j] * w[j]
+            out[i] = s
+        return out
+
+    def linear_predict(X: np.ndarray, w: np.ndarray, b: float) -> np.ndarray:
+        return _predict_jit(X, w, b)
+else:
+    def linear_predict(X: np.ndarray, w: np.ndarray, b: float) -> np.ndarray:
+        return X @ w + b
+
+def warmup(w: np.ndarray, b: float):
+    # Triggers JIT compilation at startup instead of on the first request.
+    # Both matrix dtypes the serving paths produce (float64 single rows,
+    # float32 batch chunks) get their signatures compiled here.
+    for dtype in (np.float64, np.float32):
+        linear_predict(np.zeros((1, len(w)), dtype=dtype), w, b)
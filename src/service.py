@@ -1,40 +1,42 @@
 import bentoml
 import numpy as np
-from pydantic import BaseModel
 from starlette.responses import JSONResponse
 from src.auth.jwt_auth import JWTAuthMiddleware, create_token, validate_credentials
-
-class LoginRequest(BaseModel):
-    username: str
-    password: str
-
-class AdmissionInput(BaseModel):
-    gre_score: float
-    toefl_score: float
-    university_rating: float
-    sop: float
-    lor: float
-    cgpa: float
-    research: int
+from src.batching import MicroBatcher
+from src.predict_kernel import linear_predict, warmup
 
 @bentoml.service(name="admission_service")
 class AdmissionService:
     model_ref = bentoml.models.get("admission_model:latest")
     
     def __init__(self):
-        self.model = bentoml.sklearn.load_model(self.model_ref)
-    
+        # Inference uses the extracted coefficients directly, skipping
+        # check_array and the generic predict dispatch on every request.
+        # Models saved by train_model carry them in metadata, so the
+        # estimator only gets unpickled for older artifacts.
+        metadata = self.model_ref.info.metadata or {}
+        if "coef" in metadata and "intercept" in metadata:
+            self.model = None
+            self._w = np.asarray(metadata["coef"], dtype=np.float64)
+            self._b = float(metadata["intercept"])
+        else:
+            self.model = bentoml.sklearn.load_model(self.model_ref)
+            self._w = np.asarray(self.model.coef_, dtype=np.float64)
+            self._b = float(self.model.intercept_)
+        warmup(self._w, self._b)
+        self._batcher = MicroBatcher(lambda X: linear_predict(X, self._w, self._b))
+
     @bentoml.api(route="/login")
     def login(self, username: str, password: str):
         if validate_credentials(username, password):
             return {"token": create_token(username)}
         return JSONResponse({"error": "Invalid credentials"}, status_code=401)
-    
+
     @bentoml.api(route="/predict")
-    def predict(self, gre_score: float, toefl_score: float, university_rating: float,
-                sop: float, lor: float, cgpa: float, research: int) -> dict:
-        features = np.array([[gre_score, toefl_score, university_rating, sop, lor, cgpa, research]])
-        prediction = self.model.predict(features)
-        return {"chance_of_admit": float(prediction[0])}
+    async def predict(self, gre_score: float, toefl_score: float, university_rating: float,
+                      sop: float, lor: float, cgpa: float, research: int) -> dict:
+        features = np.array([gre_score, toefl_score, university_rating, sop, lor, cgpa, research])
+        prediction = await self._batcher.submit(features)
+        return {"chance_of_admit": prediction}
 
 AdmissionService.add_asgi_middleware(JWTAuthMiddleware)
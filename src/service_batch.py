@@ -0,0 +1,211 @@
+import atexit
+import itertools
+import os
+import threading
+import time
+import uuid
+from concurrent.futures import ThreadPoolExecutor
+from operator import attrgetter
+from typing import List
+
+import bentoml
+import numpy as np
+from fastapi import Depends, FastAPI, HTTPException, Request
+from fastapi.responses import ORJSONResponse
+from fastapi.security import HTTPAuthorizationCredentials, HTTPBearer
+from pydantic import TypeAdapter, ValidationError
+from starlette.responses import JSONResponse
+
+from src.auth.jwt_auth import JWTAuthMiddleware, create_token, validate_credentials
+from src.batching import MicroBatcher
+from src.models.input_model import MAX_BATCH_SIZE, AdmissionInput
+from src.predict_kernel import linear_predict, warmup
+
+# Compiled once so batch validation is a single pass through pydantic's core
+# validator instead of one AdmissionInput(**row) construction per row.
+_ADM_LIST = TypeAdapter(List[AdmissionInput])
+
+# In-memory job store: job_id -> {status, submitted_at, total, results, ...},
+# sharded by job_id hash so bookkeeping for unrelated jobs does not
+# serialize on a single lock. Power-of-two shard count keeps the shard
+# selection a single AND.
+_NSHARDS = 16
+_shards: List[tuple] = [({}, threading.Lock()) for _ in range(_NSHARDS)]
+
+def _shard(job_id: str):
+    return _shards[hash(job_id) & (_NSHARDS - 1)]
+
+# Finished jobs are evicted after an hour and the store is capped, so a
+# long-lived process neither grows without bound nor drags a huge dict
+# through every lookup.
+_JOB_TTL = 3600
+MAX_JOBS = 10_000
+
+def _sweep_jobs():
+    while True:
+        time.sleep(60)
+        now = time.time()
+        for shard, lock in _shards:
+            with lock:
+                expired = [job_id for job_id, job in shard.items()
+                           if job.get("completed_at") and now - job["completed_at"] > _JOB_TTL]
+                for job_id in expired:
+                    del shard[job_id]
+
+threading.Thread(target=_sweep_jobs, name="job-sweeper", daemon=True).start()
+
+# Bounded worker pool for batch jobs: reuses OS threads and caps parallelism
+# instead of spawning (and tearing down) one thread per submitted job.
+_EXECUTOR = ThreadPoolExecutor(max_workers=max(4, os.cpu_count() or 4),
+                               thread_name_prefix="batch-pred")
+atexit.register(_EXECUTOR.shutdown, wait=False)
+
+service_instance = None
+
+# HTTPBearer is kept only so the OpenAPI docs advertise the auth scheme;
+# verification itself happens once, in JWTAuthMiddleware, which stashes the
+# decoded claims on request.state.
+security = HTTPBearer()
+
+def get_current_user(request: Request,
+                     credentials: HTTPAuthorizationCredentials = Depends(security)) -> dict:
+    user = getattr(request.state, "user", None)
+    if user is None:
+        raise HTTPException(status_code=401, detail="Invalid token")
+    return user
+
+_FEAT_GET = attrgetter("gre_score", "toefl_score", "university_rating",
+                       "sop", "lor", "cgpa", "research")
+
+def _build_features(inputs: List[AdmissionInput]) -> np.ndarray:
+    # One bound attrgetter per row feeding np.fromiter, which writes straight
+    # into a preallocated buffer with no intermediate per-row containers.
+    n = len(inputs)
+    flat = itertools.chain.from_iterable(map(_FEAT_GET, inputs))
+    return np.fromiter(flat, dtype=np.float32, count=n * 7).reshape(n, 7)
+
+# Rows processed per inference call; keeps the working set of a large job
+# cache-sized instead of materializing the full N x 7 matrix at once.
+_CHUNK = 256
+
+def process_batch_job(service, job_id: str, inputs: List[AdmissionInput]):
+    shard, lock = _shard(job_id)
+    with lock:
+        shard[job_id]["status"] = "processing"
+    try:
+        n = len(inputs)
+        predictions = np.empty(n, dtype=np.float32)
+        for start in range(0, n, _CHUNK):
+            chunk = inputs[start:start + _CHUNK]
+            features = _build_features(chunk)
+            predictions[start:start + len(chunk)] = linear_predict(features, service._w, service._b)
+        with lock:
+            shard[job_id]["status"] = "completed"
+            # Raw float32 predictions; serialized to dicts only at fetch time
+            # so a 1000-row batch does not allocate 1000 model instances.
+            shard[job_id]["results"] = predictions
+            shard[job_id]["completed_at"] = time.time()
+    except Exception as exc:
+        with lock:
+            shard[job_id]["status"] = "failed"
+            shard[job_id]["error"] = str(exc)
+            shard[job_id]["completed_at"] = time.time()
+
+# orjson serializes the float-heavy result payloads several times faster
+# than the stdlib encoder.
+fastapi_app = FastAPI(title="Admission Batch API", default_response_class=ORJSONResponse)
+
+@fastapi_app.post("/batch/submit")
+def batch_submit(payload: dict, user: dict = Depends(get_current_user)):
+    inputs = payload.get("inputs", [])
+    # Reject oversized or malformed batches before paying for per-row
+    # validation; a 10,000-row payload should fail on the length check alone.
+    if not isinstance(inputs, list) or not 1 <= len(inputs) <= MAX_BATCH_SIZE:
+        return JSONResponse(
+            {"error": f"batch size must be between 1 and {MAX_BATCH_SIZE}"},
+            status_code=400,
+        )
+    try:
+        admission_inputs = _ADM_LIST.validate_python(inputs)
+    except (ValidationError, ValueError, TypeError) as exc:
+        return JSONResponse({"error": str(exc)}, status_code=400)
+
+    if sum(len(shard) for shard, _ in _shards) >= MAX_JOBS:
+        return JSONResponse({"error": "Too many jobs retained, retry later"}, status_code=429)
+
+    job_id = uuid.uuid4().hex
+    shard, lock = _shard(job_id)
+    with lock:
+        shard[job_id] = {
+            "status": "pending",
+            "submitted_at": time.time(),
+            "total": len(admission_inputs),
+        }
+    _EXECUTOR.submit(process_batch_job, service_instance, job_id, admission_inputs)
+    return {"job_id": job_id, "status": "pending", "total": len(admission_inputs)}
+
+@fastapi_app.get("/batch/status/{job_id}")
+def batch_status_get(job_id: str, user: dict = Depends(get_current_user)):
+    shard, lock = _shard(job_id)
+    with lock:
+        job = shard.get(job_id)
+        if job is None:
+            return JSONResponse({"error": "Job not found"}, status_code=404)
+        return {"job_id": job_id, "status": job["status"], "total": job["total"]}
+
+@fastapi_app.get("/batch/results/{job_id}")
+def batch_results_get(job_id: str, user: dict = Depends(get_current_user)):
+    shard, lock = _shard(job_id)
+    with lock:
+        job = shard.get(job_id)
+        if job is None:
+            return JSONResponse({"error": "Job not found"}, status_code=404)
+        if job["status"] == "failed":
+            return JSONResponse({"error": job.get("error", "Job failed")}, status_code=500)
+        if job["status"] != "completed":
+            return JSONResponse({"error": "Job not completed"}, status_code=409)
+        return {
+            "job_id": job_id,
+            "status": job["status"],
+            "total": job["total"],
+            "results": [{"chance_of_admit": float(pred)} for pred in job["results"]],
+        }
+
+@bentoml.mount_asgi_app(fastapi_app)
+@bentoml.service(name="admission_service_batch")
+class AdmissionBatchService:
+    model_ref = bentoml.models.get("admission_model:latest")
+
+    def __init__(self):
+        # A single set of linear-model parameters serves both the
+        # latency-sensitive and the batch path; inference is a plain dot
+        # product. Models saved by train_model carry coef/intercept in
+        # metadata, so the estimator only gets unpickled for older artifacts.
+        metadata = self.model_ref.info.metadata or {}
+        if "coef" in metadata and "intercept" in metadata:
+            self.model = None
+            self._w = np.asarray(metadata["coef"], dtype=np.float64)
+            self._b = float(metadata["intercept"])
+        else:
+            self.model = bentoml.sklearn.load_model(self.model_ref)
+            self._w = np.asarray(self.model.coef_, dtype=np.float64)
+            self._b = float(self.model.intercept_)
+        warmup(self._w, self._b)
+        self._batcher = MicroBatcher(lambda X: linear_predict(X, self._w, self._b))
+        global service_instance
+        service_instance = self
+
+    @bentoml.api(route="/login")
+    def login(self, username: str, password: str):
+        if validate_credentials(username, password):
+            return {"token": create_token(username)}
+        return JSONResponse({"error": "Invalid credentials"}, status_code=401)
+
+    @bentoml.api(route="/predict")
+    async def predict(self, gre_score: float, toefl_score: float, university_rating: float,
+                      sop: float, lor: float, cgpa: float, research: int) -> dict:
+        features = np.array([gre_score, toefl_score, university_rating, sop, lor, cgpa, research])
+        prediction = await self._batcher.submit(features)
+        return {"chance_of_admit": prediction}
+
+AdmissionBatchService.add_asgi_middleware(JWTAuthMiddleware)
@@ -0,0 +1,10 @@
+from pathlib import Path
+
+from dotenv import load_dotenv
+
+BASE_DIR = Path(__file__).resolve().parent.parent
+
+def pytest_configure(config):
+    # Parse .env once per session (and once per xdist worker) instead of at
+    # every test-module import or --collect-only pass.
+    load_dotenv(BASE_DIR / ".env")
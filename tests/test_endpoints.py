@@ -0,0 +1,317 @@
+import json
+import numpy as np
+import pytest
+import requests
+import jwt
+import os
+import time
+from datetime import datetime, timezone
+from concurrent.futures import ThreadPoolExecutor
+from pydantic import BaseModel, Field, TypeAdapter
+from requests.adapters import HTTPAdapter
+from urllib3.util import Retry
+
+# .env is parsed once in conftest.pytest_configure before this module is
+# imported; only plain environment lookups remain on the import path.
+BASE_URL = "http://localhost:3000"
+JWT_SECRET = os.getenv("JWT_SECRET_KEY", "default_secret")
+JWT_ALGORITHM = os.getenv("JWT_ALGORITHM", "HS256")
+API_USERNAME = os.getenv("API_USERNAME", "admin")
+API_PASSWORD = os.getenv("API_PASSWORD", "secret123")
+
+# Record literals allocated once at import; fixtures hand out references
+# since no test mutates them.
+SAMPLE_RECORD = {"gre_score": 320, "toefl_score": 110, "university_rating": 3,
+                 "sop": 3.5, "lor": 3.0, "cgpa": 8.5, "research": 1}
+_RECORD_B = {"gre_score": 337, "toefl_score": 118, "university_rating": 4,
+             "sop": 4.5, "lor": 4.5, "cgpa": 9.65, "research": 1}
+_RECORD_C = {"gre_score": 300, "toefl_score": 100, "university_rating": 2,
+             "sop": 3.0, "lor": 2.5, "cgpa": 8.0, "research": 0}
+
+# Serialized once at import: the over-limit test only checks the length cap,
+# so there is no point re-encoding 1001 identical records on every run.
+_LARGE_BATCH_BYTES = ('{"inputs":[' + ','.join([json.dumps(SAMPLE_RECORD)] * 1001) + ']}').encode()
+
+# Compiled once; validates field presence and range for a whole result list
+# in a single core-schema pass.
+class _Result(BaseModel):
+    chance_of_admit: float = Field(ge=0, le=1)
+
+_RESULTS_ADAPTER = TypeAdapter(list[_Result])
+
+# The timestamps only need to be in the past, so the token is signed once at
+# import with a fixed epoch instead of per test run.
+EXPIRED_TOKEN = jwt.encode({
+    "sub": API_USERNAME,
+    "exp": int(datetime(2020, 1, 1, tzinfo=timezone.utc).timestamp()),
+    "iat": int(datetime(2019, 12, 31, tzinfo=timezone.utc).timestamp()),
+}, JWT_SECRET, algorithm=JWT_ALGORITHM)
+
+# One pooled session for the whole suite: urllib3 keep-alive reuses a single
+# TCP connection instead of opening a fresh socket per request. Retries are
+# disabled and every call gets a fail-fast default timeout so a dead server
+# surfaces immediately instead of hanging on OS defaults.
+class _TimeoutSession(requests.Session):
+    def request(self, method, url, **kwargs):
+        kwargs.setdefault("timeout", (0.5, 10))
+        return super().request(method, url, **kwargs)
+
+SESSION = _TimeoutSession()
+SESSION.mount("http://", HTTPAdapter(max_retries=Retry(total=0),
+                                     pool_connections=4, pool_maxsize=16))
+
+# orjson encodes/decodes the float-heavy payloads several times faster than
+# the stdlib encoder requests uses; fall back transparently when absent.
+try:
+    import orjson
+except ImportError:
+    orjson = None
+
+def _post_json(url, payload, headers=None):
+    if orjson is None:
+        return SESSION.post(url, json=payload, headers=headers)
+    merged = {"Content-Type": "application/json"}
+    if headers:
+        merged.update(headers)
+    return SESSION.post(url, data=orjson.dumps(payload), headers=merged)
+
+def _parse(response):
+    if orjson is None:
+        return response.json()
+    return orjson.loads(response.content)
+
+try:
+    import httpx
+except ImportError:
+    httpx = None
+
+_poll_client = None
+
+def _get_poll_client():
+    # Probed once: if the server speaks HTTP/2, the back-to-back status polls
+    # multiplex over a single h2 connection; otherwise the pooled requests
+    # session is used unchanged.
+    global _poll_client
+    if _poll_client is None:
+        _poll_client = SESSION
+        if httpx is not None:
+            client = httpx.Client(base_url=BASE_URL, http2=True, timeout=10.0)
+            try:
+                if client.get("/healthz").http_version == "HTTP/2":
+                    _poll_client = client
+                else:
+                    client.close()
+            except Exception:
+                client.close()
+    return _poll_client
+
+@pytest.fixture(scope="session", autouse=True)
+def _close_session():
+    yield
+    if _poll_client is not None and _poll_client is not SESSION:
+        _poll_client.close()
+    SESSION.close()
+
+@pytest.fixture(scope="session")
+def executor():
+    with ThreadPoolExecutor(max_workers=8) as pool:
+        yield pool
+
+@pytest.fixture(scope="session")
+def valid_token(pytestconfig):
+    # A token issued by a previous run is reused while it still has at least
+    # 30 s of validity, so a warm pytest start skips the /login round-trip.
+    # exp is read locally without verifying the signature.
+    cached = pytestconfig.cache.get("admission/valid_token", None)
+    if cached:
+        try:
+            exp = jwt.decode(cached, options={"verify_signature": False}).get("exp", 0)
+            if time.time() < exp - 30:
+                return cached
+        except jwt.InvalidTokenError:
+            pass
+    response = SESSION.post(f"{BASE_URL}/login", json={"username": API_USERNAME, "password": API_PASSWORD})
+    token = response.json().get("token")
+    if token:
+        pytestconfig.cache.set("admission/valid_token", token)
+    return token
+
+@pytest.fixture(scope="session")
+def auth_headers(valid_token):
+    # Built once; saves a string format and a dict allocation per request.
+    return {"Authorization": f"Bearer {valid_token}"}
+
+def _wait_for_completion(session, job_id, headers, timeout=30.0):
+    # Exponential backoff from 50 ms: fast jobs return almost immediately,
+    # slow ones still only see one poll per second.
+    delay = 0.05
+    deadline = time.monotonic() + timeout
+    while time.monotonic() < deadline:
+        response = session.get(f"{BASE_URL}/batch/status/{job_id}", headers=headers)
+        if _parse(response)["status"] == "completed":
+            return response
+        time.sleep(delay)
+        delay = min(delay * 2, 1.0)
+    pytest.fail(f"job {job_id} did not complete within {timeout}s")
+
+@pytest.fixture(scope="session")
+def completed_job(auth_headers, sample_batch_input):
+    # Submitted and polled to completion once per session; tests that only
+    # need a finished job share it instead of each paying a polling loop.
+    submit_response = _post_json(f"{BASE_URL}/batch/submit", sample_batch_input,
+        headers=auth_headers)
+    assert submit_response.status_code == 200
+    job_id = _parse(submit_response)["job_id"]
+
+    status_response = _wait_for_completion(_get_poll_client(), job_id, auth_headers)
+
+    results_response = SESSION.get(f"{BASE_URL}/batch/results/{job_id}",
+        headers=auth_headers)
+    # The poll loop already saw the completed status; cache it so no test
+    # needs another round-trip just to re-read it.
+    return {"job_id": job_id, "status": _parse(status_response),
+            "results": _parse(results_response)}
+
+# Read-only payloads, so one allocation per pytest run is enough.
+@pytest.fixture(scope="session")
+def sample_input():
+    return SAMPLE_RECORD
+
+@pytest.fixture(scope="session")
+def minimal_batch_input():
+    # Single record for tests that only observe status transitions; no need
+    # to make the server infer three rows per run.
+    return {"inputs": [SAMPLE_RECORD]}
+
+@pytest.fixture(scope="session")
+def sample_batch_input():
+    return {"inputs": [SAMPLE_RECORD, _RECORD_B, _RECORD_C]}
+
+# JWT Authentication Tests
+class TestJWTAuth:
+    # One parametrized probe per protected endpoint instead of a duplicated
+    # test method in every class.
+    @pytest.mark.parametrize("method,path,payload", [
+        ("POST", "/predict", SAMPLE_RECORD),
+        ("POST", "/batch/submit", {"inputs": [SAMPLE_RECORD]}),
+        ("GET", "/batch/status/some_job_id", None),
+        ("GET", "/batch/results/some_job_id", None),
+    ])
+    def test_missing_token_returns_401(self, method, path, payload):
+        response = SESSION.request(method, f"{BASE_URL}{path}", json=payload)
+        assert response.status_code == 401
+
+    def test_invalid_token_returns_401(self, sample_input):
+        response = SESSION.post(f"{BASE_URL}/predict",
+            headers={"Authorization": "Bearer invalid_token"},
+            json=sample_input)
+        assert response.status_code == 401
+
+    def test_expired_token_returns_401(self, sample_input):
+        response = SESSION.post(f"{BASE_URL}/predict",
+            headers={"Authorization": f"Bearer {EXPIRED_TOKEN}"},
+            json=sample_input)
+        assert response.status_code == 401
+
+    def test_valid_token_succeeds(self, auth_headers, sample_input):
+        response = SESSION.post(f"{BASE_URL}/predict",
+            headers=auth_headers,
+            json=sample_input)
+        assert response.status_code == 200
+
+# Login API Tests
+class TestLoginAPI:
+    def test_valid_credentials_return_token(self):
+        response = SESSION.post(f"{BASE_URL}/login", json={"username": API_USERNAME, "password": API_PASSWORD})
+        assert response.status_code == 200
+        assert "token" in response.json()
+
+    def test_invalid_credentials_return_401(self):
+        response = SESSION.post(f"{BASE_URL}/login", json={"username": "wrong", "password": "wrong"})
+        assert response.status_code == 401
+
+# Single Prediction Tests
+class TestSinglePrediction:
+    def test_valid_and_invalid_input(self, auth_headers, sample_input, executor):
+        # Both requests are independent, so they go out concurrently over the
+        # pooled session and overlap their round-trips.
+        valid_response, invalid_response = executor.map(
+            lambda payload: SESSION.post(f"{BASE_URL}/predict",
+                headers=auth_headers, json=payload),
+            [sample_input, {"invalid_field": "test"}])
+        assert valid_response.status_code == 200
+        data = valid_response.json()
+        assert "chance_of_admit" in data
+        assert 0 <= data["chance_of_admit"] <= 1
+        assert invalid_response.status_code == 400
+
+# Batch Submission Tests
+class TestBatchSubmission:
+    def test_valid_batch_submission_returns_job_id(self, auth_headers, sample_batch_input):
+        response = _post_json(f"{BASE_URL}/batch/submit", sample_batch_input,
+            headers=auth_headers)
+        assert response.status_code == 200
+        data = _parse(response)
+        assert "job_id" in data
+        assert data["status"] == "pending"
+
+    def test_large_batch_returns_error(self, auth_headers):
+        response = SESSION.post(f"{BASE_URL}/batch/submit",
+            headers={**auth_headers, "Content-Type": "application/json"},
+            data=_LARGE_BATCH_BYTES)
+        assert response.status_code == 400
+
+# Batch Status Tests
+class TestBatchStatus:
+    def test_unknown_job_returns_404(self, auth_headers):
+        response = SESSION.get(f"{BASE_URL}/batch/status/unknown_job_id",
+            headers=auth_headers)
+        assert response.status_code == 404
+
+    def test_check_pending_status(self, auth_headers, minimal_batch_input):
+        submit_response = _post_json(f"{BASE_URL}/batch/submit", minimal_batch_input,
+            headers=auth_headers)
+        assert submit_response.status_code == 200
+        job_id = _parse(submit_response)["job_id"]
+
+        status_response = SESSION.get(f"{BASE_URL}/batch/status/{job_id}",
+            headers=auth_headers)
+        assert status_response.status_code == 200
+        assert status_response.json()["status"] in ("pending", "processing", "completed")
+
+    # xdist_group keeps the tests sharing completed_job on one worker under
+    # pytest-xdist (-n auto --dist=loadgroup); everything else fans out.
+    @pytest.mark.xdist_group("batch")
+    def test_check_completed_status(self, completed_job):
+        status = completed_job["status"]
+        assert status["job_id"] == completed_job["job_id"]
+        assert status["status"] == "completed"
+
+# Batch Results Tests
+class TestBatchResults:
+    @pytest.mark.xdist_group("batch")
+    def test_retrieve_completed_results(self, sample_batch_input, completed_job):
+        data = completed_job["results"]
+        assert data["status"] == "completed"
+        assert data["total"] == len(sample_batch_input["inputs"])
+        assert len(data["results"]) == data["total"]
+
+    @pytest.mark.xdist_group("batch")
+    def test_results_format_validation(self, completed_job):
+        data = completed_job["results"]
+        validated = _RESULTS_ADAPTER.validate_python(data["results"])
+        assert len(validated) == data["total"]
+
+# Batch Workflow Tests
+class TestBatchWorkflow:
+    # The submit contract is already asserted by
+    # test_valid_batch_submission_returns_job_id; the shared fixture covers
+    # the submit -> poll -> fetch sequence without another 30 s polling loop.
+    @pytest.mark.xdist_group("batch")
+    def test_complete_batch_workflow(self, completed_job):
+        data = completed_job["results"]
+        assert data["status"] == "completed"
+        assert len(data["results"]) == data["total"]
+        arr = np.fromiter((result["chance_of_admit"] for result in data["results"]),
+                          dtype=np.float64, count=data["total"])
+        assert np.logical_and(arr >= 0.0, arr <= 1.0).all()